@@ -12,13 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import itertools
+import collections
+import functools
 
-import earthkit.data
 import matplotlib.pyplot as plt
-import numpy as np
 
-from earthkit.maps import domains, utils
+from earthkit.maps import domains, inputs, utils
 from earthkit.maps.charts import layouts
 from earthkit.maps.charts.layers import LayerGroup
 from earthkit.maps.charts.subplots import Subplot
@@ -97,16 +96,16 @@ class Chart:
         self._columns = columns
 
         self.subplots = []
-        self.__subplots_generator = None
+        self._next_position = 0
 
-        self._queue = []
+        self._queue = collections.deque()
 
     def __len__(self):
         return len(self.subplots)
 
     def __getitem__(self, i):
         if not isinstance(i, slice):
-            while i + 1 > len(self.subplots):
+            for _ in range(len(self.subplots), i + 1):
                 self.add_subplot()
         return self.subplots[i]
 
@@ -153,18 +152,6 @@ class Chart:
         """The shape of the `Chart`'s subplot layout."""
         return self.rows, self.columns
 
-    @property
-    def _subplots_generator(self):
-        if self.__subplots_generator is None:
-            self.__subplots_generator = (
-                (row, col)
-                for row, col in itertools.product(
-                    range(self.gridspec.nrows),
-                    range(self.gridspec.ncols),
-                )
-            )
-        return self.__subplots_generator
-
     def add_subplot(
         self, *args, data=None, domain=None, crs=None, row=None, column=None, **kwargs
     ):
@@ -195,7 +182,8 @@ class Chart:
             The column position at which to insert this subplot.
         """
         if row is None and column is None:
-            row, column = next(self._subplots_generator)
+            row, column = divmod(self._next_position, self.gridspec.ncols)
+            self._next_position += 1
 
         if domain is None and crs is None:
             domain = self.domain if self._custom_domain else self._domain
@@ -236,25 +224,20 @@ class Chart:
         if subplots is None:
             subplots = self.subplots
 
-        subplot_layers = [subplot.distinct_legend_layers for subplot in subplots]
-        subplot_layers = [item for sublist in subplot_layers for item in sublist]
+        # Styles compare by identity, so layers can be grouped by style id
+        groups = dict()
+        for subplot in subplots:
+            for layer in subplot.distinct_legend_layers:
+                groups.setdefault(id(layer.style), []).append(layer)
 
-        groups = []
-        for layer in subplot_layers:
-            for i in range(len(groups)):
-                if groups[i][0].style == layer.style:
-                    groups[i].append(layer)
-                    break
-            else:
-                groups.append([layer])
-
-        groups = [LayerGroup(layers) for layers in list(groups)]
+        groups = [LayerGroup(layers) for layers in groups.values()]
 
         return groups
 
     def _defer(method):
         """Defer a method's execution until this superplot has subplots."""
 
+        @functools.wraps(method)
         def wrapper(self, *args, **kwargs):
             if not self.subplots:
                 self._queue.append((method, args, kwargs))
@@ -264,13 +247,9 @@ class Chart:
         return wrapper
 
     def _expand_rows_cols(method):
+        @functools.wraps(method)
         def wrapper(self, data, *args, **kwargs):
-            if not isinstance(data, (earthkit.data.core.Base, list, np.ndarray)):
-                data = earthkit.data.from_object(data)
-            if not isinstance(data, earthkit.data.core.Base) or not hasattr(
-                data, "__len__"
-            ):
-                data = [data]
+            data = inputs.to_sequence(data)
 
             if not self.subplots:
                 num_subplots = len(data)
@@ -701,8 +680,8 @@ class Chart:
         return result
 
     def _release_queue(self):
-        while len(self._queue):
-            method, args, kwargs = self._queue.pop(0)
+        while self._queue:
+            method, args, kwargs = self._queue.popleft()
             method(self, *args, **kwargs)
 
     @schema.legend.apply()
@@ -716,20 +695,26 @@ class Chart:
         """
         legends = []
 
+        layers = self.distinct_legend_layers(subplots)
+        if not isinstance(location, (list, tuple)):
+            location = [location] * len(layers)
+        elif len(location) < len(layers):
+            raise ValueError(
+                f"got {len(location)} legend locations for {len(layers)} "
+                f"layers with distinct styles"
+            )
+
         anchor = None
         non_cbar_layers = []
-        for i, layer in enumerate(self.distinct_legend_layers(subplots)):
-            if isinstance(location, (list, tuple)):
-                loc = location[i]
-            else:
-                loc = location
-            if layer.style is not None:
-                legend = layer.style.legend(
-                    layer,
-                    *args,
-                    location=loc,
-                    **kwargs,
-                )
+        for layer, loc in zip(layers, location):
+            if layer.style is None:
+                continue
+            legend = layer.style.legend(
+                layer,
+                *args,
+                location=loc,
+                **kwargs,
+            )
             if legend.__class__.__name__ != "Colorbar":
                 non_cbar_layers.append(layer)
             else:
@@ -791,7 +776,9 @@ class Chart:
         #             y += 0.05
         #     kwargs["va"] = kwargs.get("va", kwargs.get("verticalalignment", "bottom"))
 
-        self.fig.canvas.draw()
+        # Lay out the figure without rasterising it (a full draw renders every
+        # data layer, only for the result to be discarded)
+        self.fig.draw_without_rendering()
         return self.fig.suptitle(label, y=y, **kwargs)
 
     @_defer
@@ -32,6 +32,9 @@ class Layer:
         self.mappable = mappable
         self.subplot = subplot
         self.style = style
+        # Metadata extracted for titles and labels, which is formatted
+        # repeatedly (title, legend label...) but never changes
+        self._metadata_cache = dict()
 
     @property
     def fig(self):
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+
 PRESET_SHAPES = {
     0: (0, 0),
     1: (1, 1),
@@ -44,23 +46,11 @@ def rows_cols(num_subplots, rows=None, cols=None, max_cols=8):
             rows, cols = PRESET_SHAPES[num_subplots]
         else:
             cols = max_cols
-            rows = num_subplots // max_cols + 1
+            rows = math.ceil(num_subplots / max_cols)
     elif rows is not None and cols is None:
-        if rows == 1:
-            cols = num_subplots
-        else:
-            cols = num_subplots / rows
-            if not cols.is_integer():
-                cols = int(cols) + 1
-            cols = int(cols)
+        cols = math.ceil(num_subplots / rows)
     elif rows is None and cols is not None:
-        if cols == 1:
-            rows = num_subplots
-        else:
-            rows = num_subplots / cols
-            if not rows.is_integer():
-                rows = int(rows) + 1
-            rows = int(rows)
+        rows = math.ceil(num_subplots / cols)
     else:
         if rows * cols < num_subplots:
             raise ValueError(
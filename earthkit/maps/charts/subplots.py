@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import os
 import warnings
 
 import cartopy.crs as ccrs
@@ -19,16 +21,124 @@ import cartopy.feature as cfeature
 import cartopy.io.shapereader as shpreader
 import earthkit.data
 import matplotlib.pyplot as plt
-from adjustText import adjust_text
+import numpy as np
+import shapely
 
 from earthkit.maps import domains, inputs, utils
 from earthkit.maps.charts.layers import Layer
 from earthkit.maps.domains import natural_earth
 from earthkit.maps.metadata import components
-from earthkit.maps.metadata.formatters import LayerFormatter, SubplotFormatter
+from earthkit.maps.metadata.formatters import (
+    LayerFormatter,
+    SubplotFormatter,
+    _parsed_keys,
+)
 from earthkit.maps.schemas import schema
 from earthkit.maps.styles.levels import step_range
 
+_PLATE_CARREE = ccrs.PlateCarree()
+_GEODETIC = ccrs.Geodetic()
+
+# Default text properties for polygon labels (e.g. country codes)
+_POLYGON_LABEL_KWARGS = dict(
+    ha="center",
+    va="center",
+    bbox=dict(
+        boxstyle="round",
+        ec=(0.2, 0.2, 0.2, 0),
+        fc=(0.3, 0.3, 0.3),
+    ),
+    fontsize=8,
+    weight="bold",
+    color=(0.95, 0.95, 0.95),
+    clip_on=True,
+    transform=_GEODETIC,
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _ne_feature(category, name, resolution, **kwargs):
+    """Get a (shared) Natural Earth feature for a given category and name."""
+    return cfeature.NaturalEarthFeature(category, name, resolution, **kwargs)
+
+
+# cartopy's own (auto-scaling) features, used when resolution is "auto"
+_AUTO_FEATURES = {
+    ("cultural", "admin_0_countries"): cfeature.BORDERS,
+    ("cultural", "admin_1_states_provinces"): cfeature.STATES,
+    ("physical", "land"): cfeature.LAND,
+    ("physical", "ocean"): cfeature.OCEAN,
+    ("physical", "rivers_lake_centerlines"): cfeature.RIVERS,
+    ("physical", "lakes"): cfeature.LAKES,
+}
+
+
+def _resolve_feature(category, name, resolution, **kwargs):
+    """
+    Get the Natural Earth feature for a (possibly named) resolution, along
+    with the resolved resolution.
+    """
+    resolution = natural_earth.RESOLUTIONS.get(resolution, resolution)
+    if resolution == "auto" and (category, name) in _AUTO_FEATURES:
+        return _AUTO_FEATURES[category, name], resolution
+    return _ne_feature(category, name, resolution, **kwargs), resolution
+
+
+def _label_points(geometries):
+    """
+    Get label positions for some geometries: the centroid of each geometry, or
+    of its largest part if it is a multi-part geometry.
+    """
+    geometries = np.asarray(geometries, dtype=object)
+    parts, index = shapely.get_parts(geometries, return_index=True)
+    non_empty = ~shapely.is_empty(parts)
+    parts, index = parts[non_empty], index[non_empty]
+
+    # Sort the parts of each geometry by descending area, then take the first
+    order = np.lexsort((-shapely.area(parts), index))
+    index, first = np.unique(index[order], return_index=True)
+    centroids = shapely.centroid(parts.take(order[first]))
+
+    xs = np.full(len(geometries), np.nan)
+    ys = np.full(len(geometries), np.nan)
+    xs[index] = shapely.get_x(centroids)
+    ys[index] = shapely.get_y(centroids)
+    return xs, ys
+
+
+@functools.lru_cache(maxsize=64)
+def _grouped_title_template(templates):
+    """Combine the title templates of several layers into a single template."""
+    if len(set(templates)) == 1:
+        return templates[0]
+
+    title_parts = []
+    for i, template in enumerate(templates):
+        for key in _parsed_keys(template):
+            template = template.replace("{" + key, "{" + key + f"!{i}")
+        title_parts.append(template)
+    return utils.list_to_human(title_parts)
+
+
+@functools.lru_cache(maxsize=8)
+def _shapefile_records(path, modified):
+    """
+    Get the (shared) records of a shapefile, keyed by its modification time.
+
+    Sharing the same geometry objects between subplots lets cartopy reuse
+    their projected paths on every subplot with the same projection.
+    """
+    return tuple(shpreader.Reader(path).records())
+
+
+@functools.lru_cache(maxsize=8)
+def _ne_records(category, name, resolution):
+    """Get the (shared) records of a Natural Earth shapefile."""
+    shpfilename = shpreader.natural_earth(
+        resolution=resolution, category=category, name=name
+    )
+    return tuple(shpreader.Reader(shpfilename).records())
+
 
 class Subplot:
     """
@@ -41,10 +151,7 @@ class Subplot:
             data = earthkit.data.from_object(data)
 
         if domain is None and crs is None:
-            try:
-                crs = data.projection().to_cartopy_crs()
-            except AttributeError:
-                pass
+            crs = domains.crs.from_data(data)
         return cls(chart, *args, domain=domain, crs=crs, **kwargs)
 
     def __init__(self, chart, *args, domain=None, domain_crs=None, crs=None, **kwargs):
@@ -85,37 +192,10 @@ class Subplot:
     @property
     def distinct_legend_layers(self):
         """Layers on this subplot which have a unique `Style`."""
-        unique_layers = []
+        unique_layers = dict()
         for layer in self.layers:
-            for legend_layer in unique_layers:
-                if legend_layer.style == layer.style:
-                    break
-            else:
-                unique_layers.append(layer)
-        return unique_layers
-
-    def _can_transform_first(self, method):
-        """
-        Check if the data can be transformed onto the target projection.
-
-        Some matplotlib methods can be sped up by transforming data coordinates
-        before plotting, but this is not compatible with all projections nor all
-        plotting methods. This method checks if a given domain and method is
-        compatible with `transform_first`.
-
-        Parameters
-        ----------
-        method : method
-            The class method to check for compatibility with `transform_first`.
-
-        Returns
-        -------
-        bool
-        """
-        if self.domain._can_transform_first and method.__name__ != "pcolormesh":
-            return True
-        else:
-            return False
+            unique_layers.setdefault(id(layer.style), layer)
+        return list(unique_layers.values())
 
     def plot_gridded_scalar(method):
         """
@@ -127,28 +207,35 @@ class Subplot:
             The method for which to transform input parameters to plottable
             components.
         """
+        # Some matplotlib methods can be sped up by transforming data
+        # coordinates before plotting, but pcolormesh is not compatible with
+        # `transform_first`; this never changes, so resolve it up front
+        is_pcolormesh = method.__name__ == "pcolormesh"
 
+        @functools.wraps(method)
         def wrapper(self, data, *args, transform_first=None, style=None, **kwargs):
             data = inputs.sanitise(data)
 
-            input_data = inputs.Input(
-                data, *args, domain=self.domain, style=style, **kwargs
+            input_data, transform, transform_first = self._prepare(
+                data,
+                *args,
+                transform_first=transform_first,
+                is_pcolormesh=is_pcolormesh,
+                style=style,
+                **kwargs,
             )
 
             kwargs.pop("x", None)
             kwargs.pop("y", None)
             kwargs.pop("units", None)
 
-            if transform_first is None:
-                transform_first = self._can_transform_first(method)
-
             mappable = method(
                 self,
                 input_data.x,
                 input_data.y,
                 input_data.values,
                 style=input_data.style,
-                transform=input_data.transform,
+                transform=transform,
                 transform_first=transform_first,
                 **kwargs,
             )
@@ -159,6 +246,42 @@ class Subplot:
 
         return wrapper
 
+    def _prepare(
+        self, data, *args, transform_first=None, is_pcolormesh=False, **kwargs
+    ):
+        """
+        Prepare some data for plotting with a gridded scalar method.
+
+        Returns
+        -------
+        tuple
+            The extracted `Input`, the transform to plot it with and whether
+            or not to use `transform_first`.
+        """
+        input_data = inputs.Input(data, *args, domain=self.domain, **kwargs)
+
+        transform = input_data.transform
+        if (
+            transform == self.domain.crs
+            and not is_pcolormesh
+            and self._within_x_limits(input_data.x)
+        ):
+            # Data already on the target projection need no cartopy transform
+            # (pcolormesh still needs cartopy to wrap cells at the boundary,
+            # as do x values outside the projection's limits, e.g. 0..360)
+            transform = self.ax.transData
+            transform_first = False
+        elif transform_first is None:
+            transform_first = self.domain._can_transform_first and not is_pcolormesh
+
+        return input_data, transform, transform_first
+
+    def _within_x_limits(self, x):
+        """Check if some x values all lie within this subplot's CRS x limits."""
+        x_min, x_max = self.domain.crs.x_limits
+        x = np.asarray(x)
+        return bool(x.size) and x_min <= np.nanmin(x) and np.nanmax(x) <= x_max
+
     def plot_gridded_vector(method):
         """
         Decorator for transforming input data into plottable components.
@@ -170,6 +293,7 @@ class Subplot:
             components.
         """
 
+        @functools.wraps(method)
         def wrapper(self, data, transform_first=None, style=None, **kwargs):
             if len(data) == 2:
                 u, v = data
@@ -185,9 +309,6 @@ class Subplot:
             kwargs.pop("y", None)
             kwargs.pop("units", None)
 
-            if transform_first is None:
-                transform_first = self._can_transform_first(method)
-
             mappable = method(
                 self,
                 input_data.x,
@@ -268,24 +389,21 @@ class Subplot:
             One of "low", "medium" or "high", or a named resolution from the
             Natrual Earth dataset.
         """
-        resolution = natural_earth.RESOLUTIONS.get(resolution, resolution)
-        if resolution == "auto":
-            feature = cfeature.BORDERS
-        else:
-            feature = cfeature.NaturalEarthFeature(
-                "cultural", "admin_0_countries", resolution
-            )
+        feature, resolution = _resolve_feature(
+            "cultural", "admin_0_countries", resolution
+        )
 
         if labels:
             resolution = "110m" if resolution == "auto" else resolution
-            shpfilename = shpreader.natural_earth(
-                resolution=resolution, category="cultural", name="admin_0_countries"
-            )
-            reader = shpreader.Reader(shpfilename)
+            records = _ne_records("cultural", "admin_0_countries", resolution)
             if not isinstance(labels, str):
                 labels = "ISO_A2_EH"
             self._add_polygon_labels(
-                reader, x_key="LABEL_X", y_key="LABEL_Y", label_key=labels
+                self._records_in_view(records),
+                x_key="LABEL_X",
+                y_key="LABEL_Y",
+                label_key=labels,
+                label_kwargs=label_kwargs,
             )
 
         if "color" in kwargs:
@@ -297,45 +415,60 @@ class Subplot:
         self,
         shapes,
         *args,
-        transform=ccrs.PlateCarree(),
+        transform=_PLATE_CARREE,
         adjust_labels=False,
         labels=False,
         **kwargs,
     ):
         if isinstance(shapes, str):
-            shapes = shpreader.Reader(shapes)
-        results = self.ax.add_geometries(
-            shapes.geometries(), transform, *args, **kwargs
-        )
+            try:
+                modified = os.path.getmtime(shapes)
+            except OSError:
+                modified = None
+            records = _shapefile_records(shapes, modified)
+            geometries = [record.geometry for record in records]
+        else:
+            records = None
+            geometries = shapes.geometries()
+        results = self.ax.add_geometries(geometries, transform, *args, **kwargs)
         if labels:
             label_key = labels if isinstance(labels, str) else None
             self._add_polygon_labels(
-                shapes, label_key=label_key, adjust_labels=adjust_labels
+                list(shapes.records() if records is None else records),
+                label_key=label_key,
+                adjust_labels=adjust_labels,
             )
         return results
 
+    def _records_in_view(self, records):
+        """Filter shapefile records to those which intersect the map view."""
+        x0, x1, y0, y1 = self.ax.get_extent(_PLATE_CARREE)
+        return [
+            record
+            for record in records
+            if record.bounds is not None
+            and record.bounds[0] <= x1
+            and record.bounds[2] >= x0
+            and record.bounds[1] <= y1
+            and record.bounds[3] >= y0
+        ]
+
     def _add_polygon_labels(
-        self, reader, x_key=None, y_key=None, adjust_labels=False, label_key=None
+        self,
+        records,
+        x_key=None,
+        y_key=None,
+        adjust_labels=False,
+        label_key=None,
+        label_kwargs=None,
     ):
-        records = list(reader.records())
-        label_kwargs = dict()
+        if not records:
+            return []
+
         label_kwargs = {
-            **dict(
-                ha="center",
-                va="center",
-                bbox=dict(
-                    boxstyle="round",
-                    ec=(0.2, 0.2, 0.2, 0),
-                    fc=(0.3, 0.3, 0.3),
-                ),
-                fontsize=8,
-                weight="bold",
-                color=(0.95, 0.95, 0.95),
-                clip_on=True,
-                clip_box=self.ax.bbox,
-                transform=ccrs.Geodetic(),
-            ),
-            **label_kwargs,
+            **_POLYGON_LABEL_KWARGS,
+            "clip_box": self.ax.bbox,
+            **(label_kwargs or dict()),
         }
 
         if label_key is None:
@@ -343,24 +476,24 @@ class Subplot:
                 if "name" in label_key.lower():
                     break
 
-        texts = []
-        for record in reader.records():
-            name = record.attributes[label_key]
-
-            if record.geometry.__class__.__name__ == "MultiPolygon":
-                centroid = max(record.geometry.geoms, key=lambda a: a.area).centroid
-            else:
-                centroid = record.geometry.centroid
-            x = centroid.x
-            y = centroid.y
+        if x_key and y_key:
+            xs = [record.attributes[x_key] for record in records]
+            ys = [record.attributes[y_key] for record in records]
+        else:
+            xs, ys = _label_points([record.geometry for record in records])
             if x_key:
-                x = record.attributes[x_key]
+                xs = [record.attributes[x_key] for record in records]
             if y_key:
-                y = record.attributes[y_key]
+                ys = [record.attributes[y_key] for record in records]
 
-            text = self.ax.text(x, y, name, **label_kwargs)
-            texts.append(text)
+        text = self.ax.text
+        texts = [
+            text(x, y, record.attributes[label_key], **label_kwargs)
+            for record, x, y in zip(records, xs, ys)
+        ]
         if adjust_labels:
+            from adjustText import adjust_text
+
             adjust_text(texts)
         return texts
 
@@ -376,29 +509,19 @@ class Subplot:
             One of "low", "medium" or "high", or a named resolution from the
             Natrual Earth dataset.
         """
-        resolution = natural_earth.RESOLUTIONS.get(resolution, resolution)
-        if resolution == "auto":
-            feature = cfeature.STATES
-        else:
-            feature = cfeature.NaturalEarthFeature(
-                "cultural",
-                "admin_1_states_provinces",
-                resolution,
-                facecolor="none",
-            )
+        feature, resolution = _resolve_feature(
+            "cultural", "admin_1_states_provinces", resolution, facecolor="none"
+        )
 
         if labels:
             resolution = "110m" if resolution == "auto" else resolution
-            shpfilename = shpreader.natural_earth(
-                resolution=resolution,
-                category="cultural",
-                name="admin_1_states_provinces",
-            )
-            reader = shpreader.Reader(shpfilename)
+            records = _ne_records("cultural", "admin_1_states_provinces", resolution)
             if not isinstance(labels, str):
                 labels = "name"
             self._add_polygon_labels(
-                reader, label_key=labels, adjust_labels=adjust_labels
+                self._records_in_view(records),
+                label_key=labels,
+                adjust_labels=adjust_labels,
             )
 
         if "color" in kwargs:
@@ -415,11 +538,7 @@ class Subplot:
             One of "low", "medium" or "high", or a named resolution from the
             Natrual Earth dataset.
         """
-        resolution = natural_earth.RESOLUTIONS.get(resolution, resolution)
-        if resolution == "auto":
-            feature = cfeature.LAND
-        else:
-            feature = cfeature.NaturalEarthFeature("physical", "land", resolution)
+        feature, _ = _resolve_feature("physical", "land", resolution)
         return self.ax.add_feature(feature, *args, **kwargs)
 
     @schema.ocean.apply()
@@ -432,11 +551,7 @@ class Subplot:
             One of "low", "medium" or "high", or a named resolution from the
             Natrual Earth dataset.
         """
-        resolution = natural_earth.RESOLUTIONS.get(resolution, resolution)
-        if resolution == "auto":
-            feature = cfeature.OCEAN
-        else:
-            feature = cfeature.NaturalEarthFeature("physical", "ocean", resolution)
+        feature, _ = _resolve_feature("physical", "ocean", resolution)
         return self.ax.add_feature(feature, *args, **kwargs)
 
     @schema.rivers.apply()
@@ -449,17 +564,11 @@ class Subplot:
             One of "low", "medium" or "high", or a named resolution from the
             Natrual Earth dataset.
         """
-        resolution = natural_earth.RESOLUTIONS.get(resolution, resolution)
-        if resolution == "auto":
-            feature = cfeature.RIVERS
-        else:
-            feature = cfeature.NaturalEarthFeature(
-                "physical",
-                "rivers_lake_centerlines",
-                resolution,
-                facecolor="none",
-                edgecolor=kwargs.pop("edgecolor", "#C3EDFF"),
-            )
+        feature, resolution = _resolve_feature(
+            "physical", "rivers_lake_centerlines", resolution, facecolor="none"
+        )
+        if resolution != "auto":
+            kwargs.setdefault("edgecolor", "#C3EDFF")
         return self.ax.add_feature(feature, *args, **kwargs)
 
     @schema.urban_areas.apply()
@@ -472,8 +581,7 @@ class Subplot:
             One of "low", "medium" or "high", or a named resolution from the
             Natrual Earth dataset.
         """
-        resolution = natural_earth.RESOLUTIONS.get(resolution, resolution)
-        feature = cfeature.NaturalEarthFeature("cultural", "urban_areas", resolution)
+        feature, _ = _resolve_feature("cultural", "urban_areas", resolution)
         return self.ax.add_feature(feature, *args, **kwargs)
 
     @schema.lakes.apply()
@@ -486,11 +594,7 @@ class Subplot:
             One of "low", "medium" or "high", or a named resolution from the
             Natrual Earth dataset.
         """
-        resolution = natural_earth.RESOLUTIONS.get(resolution, resolution)
-        if resolution == "auto":
-            feature = cfeature.LAKES
-        else:
-            feature = cfeature.NaturalEarthFeature("physical", "lakes", resolution)
+        feature, _ = _resolve_feature("physical", "lakes", resolution)
         return self.ax.add_feature(feature, *args, **kwargs)
 
     def cities(
@@ -503,13 +607,7 @@ class Subplot:
         **kwargs,
     ):
         density = natural_earth.RESOLUTIONS.get(density, density)
-        fname = shpreader.natural_earth(
-            resolution=density,
-            category="cultural",
-            name="populated_places",
-        )
-        reader = shpreader.Reader(fname)
-        records = list(reader.records())
+        records = _ne_records("cultural", "populated_places", density)
 
         texts = []
         for record in records:
@@ -517,7 +615,7 @@ class Subplot:
                 continue
             if self.domain.contains_point(
                 (record.geometry.x, record.geometry.y),
-                crs=ccrs.PlateCarree(),
+                crs=_PLATE_CARREE,
             ):
                 scatter_kwargs = {
                     "marker": "o",
@@ -557,7 +655,7 @@ class Subplot:
                 self.ax.scatter(
                     record.geometry.x,
                     record.geometry.y,
-                    transform=ccrs.PlateCarree(),
+                    transform=_PLATE_CARREE,
                     zorder=10,
                     **scatter_kwargs,
                 )
@@ -565,7 +663,7 @@ class Subplot:
                     record.geometry.x,
                     record.geometry.y,
                     record.attributes["NAME_EN"],
-                    transform=ccrs.PlateCarree(),
+                    transform=_PLATE_CARREE,
                     clip_on=True,
                     zorder=10,
                     **text_kwargs,
@@ -577,6 +675,8 @@ class Subplot:
                 "minimise overlaps, which can take a long time. This behaviour "
                 "can be switched off by passing `adjust_labels=False`."
             )
+            from adjustText import adjust_text
+
             adjust_text(texts)
         return texts
 
@@ -586,7 +686,7 @@ class Subplot:
 
             img = PIL.Image.open(img)
         if transform is None:
-            transform = ccrs.PlateCarree()
+            transform = _PLATE_CARREE
         return self.ax.imshow(img, origin=origin, extent=extent, transform=transform)
 
     def stock_img(self, *args, **kwargs):
@@ -631,18 +731,9 @@ class Subplot:
 
     @property
     def _default_title_template(self):
-        templates = [layer._default_title_template for layer in self.layers]
-        if len(set(templates)) == 1:
-            template = templates[0]
-        else:
-            title_parts = []
-            for i, template in enumerate(templates):
-                keys = [k for _, k, _, _ in SubplotFormatter().parse(template)]
-                for key in set(keys):
-                    template = template.replace("{" + key, "{" + key + f"!{i}")
-                title_parts.append(template)
-            template = utils.list_to_human(title_parts)
-        return template
+        return _grouped_title_template(
+            tuple(layer._default_title_template for layer in self.layers)
+        )
 
     @schema.title.apply()
     def title(self, label=None, unique=True, wrap=True, **kwargs):
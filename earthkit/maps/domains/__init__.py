@@ -27,13 +27,14 @@ def parse(domain, crs):
     from earthkit.data.utils.bbox import BoundingBox
     from earthkit.data.utils.projections import Projection
 
+    from earthkit.maps.domains import crs as crs_module
     from earthkit.maps.schemas import schema
 
     if isinstance(domain, BoundingBox):
         domain = [domain.west, domain.east, domain.south, domain.north]
 
     if isinstance(crs, Projection):
-        crs = crs.to_cartopy_crs()
+        crs = crs_module.from_projection(crs)
 
     if isinstance(domain, str):
         domain = Domain.from_string(domain, crs)
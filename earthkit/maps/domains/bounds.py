@@ -15,6 +15,8 @@
 import cartopy.crs as ccrs
 import numpy as np
 
+from earthkit.maps.domains.crs import transform_points
+
 CYCLIC_SYSTEMS = ["PlateCarree", "Mercator"]
 
 
@@ -44,9 +46,7 @@ def from_geometry(geom, crs=None):
     y = np.concatenate([g.boundary.xy[1] for g in iterator])
 
     if crs is not None:
-        xy = crs.transform_points(x=x, y=y, src_crs=ccrs.PlateCarree())
-        x = [point[0] for point in xy]
-        y = [point[1] for point in xy]
+        x, y = transform_points(x, y, ccrs.PlateCarree(), crs)
     elif any(lon in (min(x), max(x)) for lon in (-180, 180)):
         x = [v % 360 for v in x]
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import cartopy.crs as ccrs
+import numpy as np
 
 DEFAULT_CRS = ccrs.PlateCarree()
 
@@ -94,6 +95,89 @@ def parse(crs):
     return crs
 
 
+def transform_points(x, y, source_crs, target_crs):
+    """
+    Transform arrays of x and y coordinates from one CRS to another.
+
+    Unlike `cartopy.crs.CRS.transform_points`, this returns separate x and y
+    arrays rather than a single (N, 3) array.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        The x coordinates to transform.
+    y : numpy.ndarray
+        The y coordinates to transform.
+    source_crs : cartopy.crs.CRS
+        The CRS of the input coordinates.
+    target_crs : cartopy.crs.CRS
+        The CRS into which to transform the coordinates.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The transformed x and y coordinates, with NaNs where points could not
+        be transformed.
+    """
+    points = target_crs.transform_points(source_crs, np.asarray(x), np.asarray(y))
+    return points[..., 0], points[..., 1]
+
+
+# cartopy CRSs built from earthkit-data projections, shared between all fields
+# with the same projection parameters
+_PROJECTION_CRS = dict()
+
+
+def from_projection(projection):
+    """
+    Convert an earthkit-data projection into a cartopy CRS.
+
+    Building a cartopy CRS initialises a new PROJ object, so one CRS is built
+    per distinct set of projection parameters and shared between fields.
+
+    Parameters
+    ----------
+    projection : earthkit.data.utils.projections.Projection
+        The projection to convert.
+
+    Returns
+    -------
+    cartopy.crs.CRS
+    """
+    try:
+        key = (
+            type(projection),
+            repr(sorted(projection.parameters.items())),
+            repr(sorted(projection.globe.items())),
+        )
+    except AttributeError:
+        return projection.to_cartopy_crs()
+    if key not in _PROJECTION_CRS:
+        _PROJECTION_CRS[key] = projection.to_cartopy_crs()
+    return _PROJECTION_CRS[key]
+
+
+def from_data(data, default=None):
+    """
+    Get the cartopy CRS of some earthkit data.
+
+    Parameters
+    ----------
+    data : earthkit.data.core.Base
+        The data for which to get a CRS.
+    default : cartopy.crs.CRS, optional
+        The CRS to return if the data does not describe its projection.
+
+    Returns
+    -------
+    cartopy.crs.CRS
+    """
+    try:
+        return from_projection(data.projection())
+    except AttributeError:
+        return default
+
+
 def from_dict(kwargs):
     """
     Convert a dictionary representation of a CRS into a cartopy CRS.
@@ -13,13 +13,25 @@
 # limitations under the License.
 
 import warnings
+from functools import lru_cache
 
 import cartopy.crs as ccrs
 import numpy as np
 
 from earthkit.maps import data, domains
 
-DOMAIN_LOOKUP = data.load("domains")
+
+@lru_cache(maxsize=None)
+def _domain_lookup():
+    """Load (once) the definitions of named domains."""
+    return data.load("domains")
+
+
+def __getattr__(name):
+    # The named domains are only loaded when first needed, not at import
+    if name == "DOMAIN_LOOKUP":
+        return _domain_lookup()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 NO_TRANSFORM_FIRST = [
@@ -59,8 +71,8 @@ class Domain:
         if crs is not None:
             crs = domains.crs.parse(crs)
 
-        if domain_name is not None and domain_name in DOMAIN_LOOKUP["domains"]:
-            domain_config = DOMAIN_LOOKUP["domains"][domain_name]
+        if domain_name is not None and domain_name in _domain_lookup()["domains"]:
+            domain_config = _domain_lookup()["domains"][domain_name]
             if isinstance(domain_config, list):
                 bounds = domain_config
                 domain_crs = None
@@ -89,8 +101,7 @@ class Domain:
 
     @classmethod
     def from_data(cls, data):
-        crs = data.projection().to_cartopy_crs()
-        return cls(crs=crs)
+        return cls(crs=domains.crs.from_projection(data.projection()))
 
     def __init__(self, bounds=None, crs=None, domain_name=None):
         if crs is None:
@@ -183,7 +194,7 @@ class Domain:
                 if roll_by is not None:
                     points["x"] = np.roll(points["x"], roll_by, axis=1)
                     points["y"] = np.roll(points["y"], roll_by, axis=1)
-                    values = np.roll(values, roll_by, axis=1)
+                    values = np.roll(values, roll_by, axis=-1)
 
                 if self._can_bbox:
 
@@ -197,52 +208,66 @@ class Domain:
                             "up this process."
                         )
                     finally:
-                        bbox = np.where(
-                            (points["x"] >= crs_bounds[0])
-                            & (points["x"] <= crs_bounds[1])
-                            & (points["y"] >= crs_bounds[2])
-                            & (points["y"] <= crs_bounds[3]),
-                            True,
-                            False,
-                        )
-
-                        kernel = np.ones((8, 8), dtype="uint8")
-                        bbox = sn.morphology.binary_dilation(
-                            bbox,
-                            kernel,
-                        ).astype(bool)
-
-                        shape = bbox[
-                            np.ix_(np.any(bbox, axis=1), np.any(bbox, axis=0))
-                        ].shape
-
-                        points["x"] = points["x"][bbox].reshape(shape)
-                        points["y"] = points["y"][bbox].reshape(shape)
-                        values = values[bbox].reshape(shape)
+                        bbox = points["x"] >= crs_bounds[0]
+                        bbox &= points["x"] <= crs_bounds[1]
+                        bbox &= points["y"] >= crs_bounds[2]
+                        bbox &= points["y"] <= crs_bounds[3]
+
+                        # an 8x8 dilation is separable into two 1D passes,
+                        # which gives an identical mask at a fraction of the cost
+                        for kernel in ((8, 1), (1, 8)):
+                            bbox = sn.morphology.binary_dilation(
+                                bbox,
+                                np.ones(kernel, dtype="uint8"),
+                            )
+
+                        rows = np.flatnonzero(np.any(bbox, axis=1))
+                        columns = np.flatnonzero(np.any(bbox, axis=0))
+
+                        if _is_contiguous(rows) and _is_contiguous(columns):
+                            # a contiguous block can be sliced as a view,
+                            # avoiding boolean-mask copies of every array
+                            window = (
+                                slice(rows[0], rows[-1] + 1),
+                                slice(columns[0], columns[-1] + 1),
+                            )
+                            points["x"] = points["x"][window]
+                            points["y"] = points["y"][window]
+                            values = values[(Ellipsis,) + window]
+                        else:
+                            shape = (len(rows), len(columns))
+                            points["x"] = points["x"][bbox].reshape(shape)
+                            points["y"] = points["y"][bbox].reshape(shape)
+                            values = values[..., bbox].reshape(
+                                values.shape[:-2] + shape
+                            )
 
         return values, points
 
-    def bbox(self, field):
+    def bbox(self, field, values=None):
 
-        try:
-            source_crs = field.projection().to_cartopy_crs()
-        except AttributeError:
-            source_crs = ccrs.PlateCarree()
+        source_crs = domains.crs.from_data(field, default=ccrs.PlateCarree())
 
         points = field.to_points(flatten=False)
-        values = field.to_numpy(flatten=False)
+        if values is None:
+            values = field.to_numpy(flatten=False)
 
         return self._extract_bbox(values, points, source_crs)
 
 
+def _is_contiguous(indices):
+    """Check if a sorted array of indices forms a single unbroken run."""
+    return len(indices) > 0 and indices[-1] - indices[0] + 1 == len(indices)
+
+
 def lookup_name(domain_name):
     """Format a domain name."""
     # normalise the input string and the lookup key
     domain_name = domain_name.lower().replace("_", " ")
-    name_mapping = {k.lower(): k for k in DOMAIN_LOOKUP["domains"]}
+    name_mapping = {k.lower(): k for k in _domain_lookup()["domains"]}
 
     if domain_name not in name_mapping:
-        for name, alt_names in DOMAIN_LOOKUP["alternate_names"].items():
+        for name, alt_names in _domain_lookup()["alternate_names"].items():
             if domain_name in [alt_name.lower() for alt_name in alt_names]:
                 domain_name = name
                 break
@@ -12,12 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
+
 import cartopy.crs as ccrs
 import earthkit.data
 import numpy as np
 from cartopy.util import add_cyclic_point
 
-from earthkit.maps import styles
+from earthkit.maps import domains, styles
 from earthkit.maps.schemas import schema
 
 _NO_EARTHKIT_REGRID = False
@@ -38,6 +40,7 @@ class Input:
         self._data = data
         self._transform = transform
 
+        self._field = None
         self._converted_values = None
 
         self._style = style
@@ -50,16 +53,18 @@ class Input:
 
     @property
     def data(self):
-        if not isinstance(self._data, (earthkit.data.core.Base, list, np.ndarray)):
-            self._data = earthkit.data.from_object(self._data)
-        if isinstance(self._data, earthkit.data.core.Base) and hasattr(
-            self._data, "__len__"
-        ):
-            try:
-                self._data = self._data[0]
-            except (ValueError, TypeError, AttributeError):
-                pass
-        return self._data
+        if self._field is None:
+            data = self._data
+            if not isinstance(data, (earthkit.data.core.Base, list, np.ndarray)):
+                data = earthkit.data.from_object(data)
+            if isinstance(data, earthkit.data.core.Base) and hasattr(data, "__len__"):
+                try:
+                    data = data[0]
+                except (ValueError, TypeError, AttributeError):
+                    pass
+            # indexing a fieldlist can decode its messages, so only do it once
+            self._data = self._field = data
+        return self._field
 
     @property
     def source_units(self):
@@ -80,10 +85,9 @@ class Input:
     @property
     def transform(self):
         if self._transform is None:
-            try:
-                self._transform = self._data.projection().to_cartopy_crs()
-            except AttributeError:
-                self._transform = ccrs.PlateCarree()
+            self._transform = domains.crs.from_data(
+                self._data, default=ccrs.PlateCarree()
+            )
         return self._transform
 
     @property
@@ -97,28 +101,35 @@ class Input:
 
     @property
     def values(self):
-        return self.style.convert_units(
-            self._values,
-            self.source_units,
-            self.short_name,
-        )
+        if self._converted_values is None:
+            self._converted_values = self.style.convert_units(
+                self._values,
+                self.source_units,
+                self.short_name,
+            )
+        return self._converted_values
 
     @property
     def gridspec(self):
-        if self.data.metadata("gridType", default="") == "reduced_gg":
-            n = self.data.metadata("N", default=None)
+        data = self.data
+        grid_type = data.metadata("gridType", default="")
+        if grid_type == "reduced_gg":
+            n = data.metadata("N", default=None)
             if n is not None:
-                if self.data.metadata("isOctahedral", default=0):
+                if data.metadata("isOctahedral", default=0):
                     g = f"O{n}"
                 else:
                     g = f"N{n}"
             return {"grid": g}
-        elif self.data.metadata("gridType", default="") == "healpix":
-            n = self.data.metadata("Nside", default=None)
-            o = self.data.metadata("orderingConvention", default=None)
+        elif grid_type == "healpix":
+            n = data.metadata("Nside", default=None)
+            o = data.metadata("orderingConvention", default=None)
             if n is not None and o is not None:
                 return {"grid": f"H{n}", "ordering": o}
 
+    def _source_values(self, flatten=False):
+        return self.data.to_numpy(flatten=flatten)
+
     def extract(self, domain=None):
         if self.x is None and self.y is None:
 
@@ -129,8 +140,10 @@ class Input:
                         f"'{self.gridspec['grid']}' grid"
                     )
                 points = get_points(schema.interpolate_target_resolution)
-                self._values = earthkit.regrid.interpolate(
-                    self.data.values,
+                self._values = np.apply_along_axis(
+                    earthkit.regrid.interpolate,
+                    -1,
+                    self._source_values(flatten=True),
                     self.gridspec,
                     {
                         "grid": [
@@ -143,10 +156,10 @@ class Input:
                     self._values, points = domain.latlon_bbox(self._values, points)
             else:
                 if domain is None:
-                    self._values = self.data.to_numpy(flatten=False)
+                    self._values = self._source_values()
                     points = self.data.to_points(flatten=False)
                 else:
-                    self._values, points = domain.bbox(self.data)
+                    self._values, points = domain.bbox(self.data, self._source_values())
             self.y = points["y"]
             self.x = points["x"]
 
@@ -170,15 +183,22 @@ class Vector(Input):
         self.v = None
         super().__init__(u, *args, **kwargs)
 
-    def extract(self, domain):
-        self._data = self._u_data
-        super().extract(domain)
-        self.u = self._values
-        self.x, self.y = None, None
+    def _source_values(self, flatten=False):
+        u = self._u_data.to_numpy(flatten=flatten)
+        v = self._v_data.to_numpy(flatten=flatten)
+        if u.shape != v.shape:
+            raise ValueError(
+                f"u and v components must be on the same grid; got shapes "
+                f"{u.shape} and {v.shape}"
+            )
+        return np.stack([u, v])
 
-        self._data = self._v_data
+    def extract(self, domain):
+        # u and v share a grid, so extract them together in a single pass
+        if self.x is not None and self.y is not None:
+            self._values = np.stack([self._u_data, self._v_data])
         super().extract(domain)
-        self.v = self._values
+        self.u, self.v = self._values
 
         self._values = [self.u, self.v]
 
@@ -192,9 +212,29 @@ def get_points(dx):
     return {"x": lon, "y": lat}
 
 
-def sanitise(data):
-    if not isinstance(data, (earthkit.data.core.Base, list, np.ndarray)):
+@lru_cache(maxsize=64)
+def _is_base(data_type):
+    return issubclass(data_type, earthkit.data.core.Base)
+
+
+@lru_cache(maxsize=64)
+def _is_native(data_type):
+    return _is_base(data_type) or issubclass(data_type, (list, np.ndarray))
+
+
+def to_sequence(data):
+    """
+    Convert some input data to a sequence of plottable fields.
+
+    The type checks are cached per input type, as the same few types are
+    passed on every plot call.
+    """
+    if not _is_native(type(data)):
         data = earthkit.data.from_object(data)
-    if not isinstance(data, earthkit.data.core.Base) or not hasattr(data, "__len__"):
+    if not _is_base(type(data)) or not hasattr(data, "__len__"):
         data = [data]
-    return data[0]
+    return data
+
+
+def sanitise(data):
+    return to_sequence(data)[0]
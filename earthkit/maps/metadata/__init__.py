@@ -46,6 +46,16 @@ MAGIC_KEYS = {
     },
 }
 
+# Metadata keys to search, in order of preference, for each magic key
+_CANDIDATES = {
+    key: tuple(value["preference"]) + (key,)
+    for key, value in MAGIC_KEYS.items()
+    if "preference" in value
+}
+
+# Keys for which a missing-metadata warning has already been issued
+_WARNED = set()
+
 
 def default_label(data):
     if data.metadata("type") == "an":
@@ -74,18 +84,17 @@ def extract(data, attr, default=None):
             def search(x, default):
                 return data.attrs["reduce_attrs"][data_key].get(x, default)
 
-        candidates = [attr]
-        if attr in MAGIC_KEYS:
-            if "function" in MAGIC_KEYS[attr]:
-                return MAGIC_KEYS[attr]["function"](data)
-            else:
-                candidates = MAGIC_KEYS[attr]["preference"] + candidates
+        if attr in MAGIC_KEYS and "function" in MAGIC_KEYS[attr]:
+            return MAGIC_KEYS[attr]["function"](data)
+        candidates = _CANDIDATES.get(attr, (attr,))
 
         for item in candidates:
             label = search(item, default=None)
             if label is not None:
                 break
         else:
-            warnings.warn(f'No key "{attr}" found in layer metadata.')
+            if attr not in _WARNED:
+                _WARNED.add(attr)
+                warnings.warn(f'No key "{attr}" found in layer metadata.', stacklevel=2)
 
     return label or default
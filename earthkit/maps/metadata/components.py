@@ -37,16 +37,25 @@ COMPONENTS = {
 }
 
 
+# Flattened (key, value) criteria for each component, in order of preference
+_CRITERIA = {
+    component: tuple(
+        item for criteria in details["criteria"] for item in criteria.items()
+    )
+    for component, details in COMPONENTS.items()
+}
+
+
 def extract(data, components):
+    # Components are matched on the same few keys, so look each up only once
+    found = dict()
     results = []
     for component in components:
-        for criteria in COMPONENTS[component]["criteria"]:
-            for key, value in criteria.items():
-                if value in data.metadata(key, default=None):
-                    break
-            else:
-                continue
-            break
+        for key, value in _CRITERIA[component]:
+            if key not in found:
+                found[key] = data.metadata(key, default=None)
+            if value in found[key]:
+                break
         else:
             raise KeyError(f"No component '{component}' found in data")
         results.append(data.sel(**{key: value}))
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import itertools
+from functools import cached_property, lru_cache
 from string import Formatter
 
 import numpy as np
@@ -20,6 +21,27 @@ import numpy as np
 from earthkit.maps import metadata, utils
 
 
+def _unique(values):
+    """Remove duplicate values from a list, preserving order where possible."""
+    try:
+        return list(dict.fromkeys(values))
+    except TypeError:  # unhashable values
+        return values
+
+
+@lru_cache(maxsize=256)
+def _parse(format_string):
+    """Get the (shared) parsed tokens of a format string."""
+    return tuple(Formatter().parse(format_string))
+
+
+@lru_cache(maxsize=256)
+def _parsed_keys(format_string):
+    """Get the unique field names in a format string, in order of appearance."""
+    keys = (i[1] for i in _parse(format_string) if i[1] is not None)
+    return tuple(dict.fromkeys(keys))
+
+
 class BaseFormatter(Formatter):
     """
     Formatter of earthkit-maps components, enabling convient titles and labels.
@@ -36,6 +58,9 @@ class BaseFormatter(Formatter):
         "units": "units",
     }
 
+    def parse(self, format_string):
+        return _parse(format_string)
+
     def convert_field(self, value, conversion):
         if conversion == "u":
             return str(value).upper()
@@ -44,8 +69,7 @@ class BaseFormatter(Formatter):
         return super().convert_field(value, conversion)
 
     def format_keys(self, format_string, kwargs):
-        keys = (i[1] for i in self.parse(format_string) if i[1] is not None)
-        for key in keys:
+        for key in _parsed_keys(format_string):
             kwargs[key] = self.format_key(key)
         return kwargs
 
@@ -65,25 +89,28 @@ class LayerFormatter(BaseFormatter):
     def __init__(self, layer):
         self.layer = layer
 
-    def format_keys(self, format_string, kwargs):
-        keys = (i[1] for i in self.parse(format_string) if i[1] is not None)
-        for key in keys:
-            kwargs[key] = self.format_key(key)
-        return kwargs
-
     def format_key(self, key):
         if key in self.SUBPLOT_ATTRIBUTES:
             value = getattr(self.layer.subplot, self.SUBPLOT_ATTRIBUTES[key])
         elif key in self.STYLE_ATTRIBUTES and self.layer.style is not None:
             value = getattr(self.layer.style, self.STYLE_ATTRIBUTES[key])
             if value is None:
-                value = metadata.extract(self.layer.data, key)
+                value = self._extract(key)
                 if key == "units":
                     value = metadata.units.format_units(value)
         else:
-            value = metadata.extract(self.layer.data, key)
+            value = self._extract(key)
         return value
 
+    def _extract(self, key):
+        """Extract (and cache on the layer) a metadata value for a key."""
+        cache = getattr(self.layer, "_metadata_cache", None)
+        if cache is None:
+            return metadata.extract(self.layer.data, key)
+        if key not in cache:
+            cache[key] = metadata.extract(self.layer.data, key)
+        return cache[key]
+
 
 class SubplotFormatter(BaseFormatter):
     """
@@ -108,21 +135,31 @@ class SubplotFormatter(BaseFormatter):
         if key in self.SUBPLOT_ATTRIBUTES:
             values = [getattr(self.subplot, self.SUBPLOT_ATTRIBUTES[key])]
         else:
-            values = [
-                LayerFormatter(layer).format_key(key) for layer in self.subplot.layers
-            ]
+            values = [formatter.format_key(key) for formatter in self._layer_formatters]
         return values
 
+    @cached_property
+    def _layer_formatters(self):
+        return [LayerFormatter(layer) for layer in self.subplot.layers]
+
     def format_field(self, value, format_spec):
         f = super().format_field
         if isinstance(value, list):
-            values = [f(v, format_spec) for v in value]
+            # Single-layer fast path; nothing to deduplicate or join
+            if len(value) == 1 and self._layer_index is None:
+                return f(value[0], format_spec)
             if self._layer_index is not None:
-                value = values[self._layer_index]
+                value = f(value[self._layer_index], format_spec)
                 self._layer_index = None
+                return value
+            if self.unique:
+                # Formatted strings are deduplicated as they are produced
+                values = list(dict.fromkeys(f(v, format_spec) for v in _unique(value)))
+            else:
+                values = [f(v, format_spec) for v in value]
+            if len(values) == 1:
+                value = values[0]
             else:
-                if self.unique:
-                    values = list(dict.fromkeys(values))
                 value = utils.list_to_human(values)
         return value
 
@@ -147,22 +184,34 @@ class ChartFormatter(BaseFormatter):
             return f(value, conversion)
 
     def format_key(self, key):
-        values = [
-            SubplotFormatter(subplot).format_key(key) for subplot in self.subplots
-        ]
-        values = [item for sublist in values for item in sublist]
-        return values
+        return list(
+            itertools.chain.from_iterable(
+                formatter.format_key(key) for formatter in self._subplot_formatters
+            )
+        )
+
+    @cached_property
+    def _subplot_formatters(self):
+        return [SubplotFormatter(subplot) for subplot in self.subplots]
 
     def format_field(self, value, format_spec):
         f = super().format_field
         if isinstance(value, list):
-            values = [f(v, format_spec) for v in value]
+            # Single-layer fast path; nothing to deduplicate or join
+            if len(value) == 1 and self._layer_index is None:
+                return f(value[0], format_spec)
             if self._layer_index is not None:
-                value = values[self._layer_index]
+                value = f(value[self._layer_index], format_spec)
                 self._layer_index = None
+                return value
+            if self.unique:
+                # Formatted strings are deduplicated as they are produced
+                values = list(dict.fromkeys(f(v, format_spec) for v in _unique(value)))
+            else:
+                values = [f(v, format_spec) for v in value]
+            if len(values) == 1:
+                value = values[0]
             else:
-                if self.unique:
-                    values = list(dict.fromkeys(values))
                 value = utils.list_to_human(values)
         return value
 
@@ -180,10 +229,11 @@ class TimeFormatter:
         def wrapper(self):
             attr = method.__name__
             times = [self._named_time(time, attr) for time in self.times]
-            _, indices = np.unique(times, return_index=True)
-            return [times[i] for i in sorted(indices)]
+            return list(dict.fromkeys(times))
 
-        return property(wrapper)
+        # lead_time reads base_time and valid_time several times, so each is
+        # only extracted once per formatter
+        return cached_property(wrapper)
 
     @staticmethod
     def _named_time(time, attr):
@@ -201,21 +251,18 @@ class TimeFormatter:
     def valid_time(self):
         pass
 
-    @property
+    @cached_property
     def lead_time(self):
-        if len(self.base_time) == 1 and len(self.valid_time) > 1:
-            times = itertools.product(self.base_time, self.valid_time)
-        elif len(self.base_time) == len(self.valid_time):
-            times = zip(self.base_time, self.valid_time)
-        else:
-            times = [
-                (
-                    self._named_time(time, "base_time"),
-                    self._named_time(time, "valid_time"),
-                )
-                for time in self.times
-            ]
-        return [int((vtime - btime).total_seconds() / 3600) for btime, vtime in times]
+        base_time, valid_time = self.base_time, self.valid_time
+        # A single base time is broadcast against all valid times
+        if len(base_time) != 1 and len(base_time) != len(valid_time):
+            base_time = [self._named_time(time, "base_time") for time in self.times]
+            valid_time = [self._named_time(time, "valid_time") for time in self.times]
+        lead_time = np.asarray(valid_time, dtype="datetime64[s]") - np.asarray(
+            base_time, dtype="datetime64[s]"
+        )
+        # Whole hours, truncated towards zero
+        return (lead_time / np.timedelta64(1, "h")).astype(int).tolist()
 
 
 def format_month(data):
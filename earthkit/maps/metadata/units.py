@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib.util
+from functools import lru_cache
 
-_NO_CF_UNITS = False
-try:
-    import cf_units
-except ImportError:
-    _NO_CF_UNITS = True
+# cf-units (and its udunits2 bindings) is only imported when first needed
+_NO_CF_UNITS = importlib.util.find_spec("cf_units") is None
+_CF_UNITS_IMPORTED = False
 
 
 TEMPERATURE_ANOM_UNITS = [
@@ -32,10 +32,45 @@ PRETTY_UNITS = {
 }
 
 
+def _has_cf_units():
+    """
+    Import cf-units on first use, and check whether it is available.
+
+    cf-units can be installed but still fail to import (e.g. if udunits2 is
+    missing), in which case it is treated as not installed.
+    """
+    global _NO_CF_UNITS, _CF_UNITS_IMPORTED
+    if not (_NO_CF_UNITS or _CF_UNITS_IMPORTED):
+        try:
+            import cf_units  # noqa: F401
+            import cf_units.tex  # noqa: F401
+        except (ImportError, OSError):
+            _NO_CF_UNITS = True
+        else:
+            _CF_UNITS_IMPORTED = True
+    return not _NO_CF_UNITS
+
+
+@lru_cache(maxsize=256)
+def _unit(units):
+    """Get a (shared) `cf_units.Unit` for a units string."""
+    import cf_units
+
+    return cf_units.Unit(units)
+
+
+@lru_cache(maxsize=None)
+def _pretty_units():
+    """Map canonical `cf_units.Unit` objects to their pretty representations."""
+    return {_unit(name): formatted for name, formatted in PRETTY_UNITS.items()}
+
+
 def are_equal(unit_1, unit_2):
-    if _NO_CF_UNITS:
+    if unit_1 == unit_2:
+        return True
+    if not _has_cf_units():
         raise ImportError("cf-units is required for checking unit equivalence")
-    return cf_units.Unit(unit_1) == cf_units.Unit(unit_2)
+    return _unit(unit_1) == _unit(unit_2)
 
 
 def anomaly_equivalence(units):
@@ -43,29 +78,28 @@ def anomaly_equivalence(units):
 
 
 def convert(data, source_units, target_units):
-    if _NO_CF_UNITS:
+    if not _has_cf_units():
         raise ImportError("cf-units is required for unit conversion")
-    return cf_units.Unit(source_units).convert(data, target_units)
+    return _unit(source_units).convert(data, _unit(target_units))
 
 
 def format_units(units):
-    if _NO_CF_UNITS:
+    if not _has_cf_units():
         return f"${PRETTY_UNITS.get(units, units)}$"
+    return _format_units(units)
+
 
+@lru_cache(maxsize=256)
+def _format_units(units):
+    """Format units as (cached) TeX, using cf-units."""
     from cf_units.tex import tex
 
-    for name, formatted_units in PRETTY_UNITS.items():
-        try:
-            if are_equal(units, name):
-                units = formatted_units
-                break
-        except ValueError:
-            continue
+    try:
+        unit = _unit(units)
+    except ValueError:
+        pass
     else:
-        try:
-            units = str(cf_units.Unit(units))
-        except ValueError:
-            pass
+        units = _pretty_units().get(unit, str(unit))
 
     try:
         formatted_units = f"${tex(units)}$"
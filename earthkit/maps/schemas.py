@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import functools
 import os
 
 import yaml
@@ -22,11 +24,23 @@ from earthkit.maps.utils import recursive_dict_update
 
 _DEFAULT_SCHEMA = "default"
 
+_MISSING = object()
+
+# Use the C (libyaml) parser where available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SchemaNotFoundError(FileNotFoundError):
     pass
 
 
+@functools.lru_cache(maxsize=8)
+def _load_schema(file_name, modified):
+    """Load (and cache) a schema file, keyed by its modification time."""
+    with open(file_name, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 class _set:
     def __init__(self, schema, **kwargs):
         self.schema = schema
@@ -66,17 +80,15 @@ class Schema(dict):
         self._update(**kwargs)
 
     def __getattr__(self, key):
-        if key in self:
-            return self[key]
-        raise AttributeError(key)
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(key)
+        return value
 
     def __setattr__(self, key, value):
         if isinstance(value, dict) and not isinstance(value, Schema):
             value = Schema(**value)
-        try:
-            self[key] = value
-        except KeyError:
-            raise AttributeError(key)
+        self[key] = value
 
     def __repr__(self):
         return f"{self.__class__.__name__}({super().__repr__()})"
@@ -89,6 +101,7 @@ class Schema(dict):
 
     def apply(self, *keys):
         def decorator(function):
+            @functools.wraps(function)
             def wrapper(*args, **kwargs):
                 return function(*args, **self._update_kwargs(kwargs, keys))
 
@@ -103,13 +116,12 @@ class Schema(dict):
         return recursive_dict_update(schema_kwargs, kwargs)
 
     def _to_dict(self):
-        d = dict()
-        for key in self:
-            value = getattr(self, key)
-            if isinstance(value, type(self)):
-                value = value._to_dict()
-            d[key] = value
-        return d
+        # Items are read directly, rather than through attribute access, which
+        # would first fail a regular attribute lookup for every key
+        return {
+            key: value._to_dict() if isinstance(value, Schema) else value
+            for key, value in self.items()
+        }
 
     def set(self, **kwargs):
         """
@@ -169,9 +181,8 @@ class Schema(dict):
                 file_name = name
             else:
                 raise SchemaNotFoundError(f"no schema '{name}' found")
-        with open(file_name, "r") as f:
-            kwargs = yaml.load(f, Loader=yaml.SafeLoader)
-        self._reset(**kwargs)
+        kwargs = _load_schema(str(file_name), os.stat(file_name).st_mtime_ns)
+        self._reset(**copy.deepcopy(kwargs))
 
     def _reset(self, **kwargs):
         self.__init__(**kwargs)
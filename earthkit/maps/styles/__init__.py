@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import warnings
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import Collection
 
 from earthkit.maps import metadata, styles
 from earthkit.maps.schemas import schema
@@ -72,6 +74,12 @@ class Style:
         A list of categorical labels for each bin in the legend.
     """
 
+    CMAP_CACHE_SIZE = 8
+    """
+    The maximum number of colormaps and norms (one per set of levels) that
+    each `Style` keeps for reuse.
+    """
+
     @classmethod
     def from_dict(cls, kwargs):
         style_type = kwargs.pop("type")
@@ -108,7 +116,7 @@ class Style:
         self.normalize = normalize
         self.gradients = gradients
 
-        if units is not None and metadata.units._NO_CF_UNITS:
+        if units is not None and not metadata.units._has_cf_units():
             warnings.warn(
                 "You must have cf-units installed to use unit conversion "
                 "features; since no cf-units installation was found, no units "
@@ -131,6 +139,10 @@ class Style:
 
         self._kwargs = kwargs
 
+        # Colormaps and norms, shared by every plot of the same levels; bounded
+        # because levels derived from data change with every new data range
+        self._cmap_cache = collections.OrderedDict()
+
     # TODO
     # def to_yaml(self):
     #     pass
@@ -162,6 +174,22 @@ class Style:
                 )
         return self._levels.apply(data)
 
+    def _cmap_and_norm(self, colors, levels):
+        """Get a (cached) colormap and norm for some colors and levels."""
+        key = (id(colors), tuple(levels), self.normalize, self.extend)
+        if key in self._cmap_cache:
+            self._cmap_cache.move_to_end(key)
+        else:
+            self._cmap_cache[key] = styles.colors.cmap_and_norm(
+                colors,
+                levels,
+                self.normalize,
+                self.extend,
+            )
+            if len(self._cmap_cache) > self.CMAP_CACHE_SIZE:
+                self._cmap_cache.popitem(last=False)
+        return self._cmap_cache[key]
+
     @property
     def extend(self):
         """Convenience access to 'extend' kwarg."""
@@ -195,6 +223,10 @@ class Style:
         if self._units is None or source_units is None:
             return values
 
+        # Skip the (copying) conversion when the units already match
+        if metadata.units.are_equal(source_units, self._units):
+            return values
+
         # For temperature anomalies we do not want to convert values, just
         # change the units string
         if "anomaly" in short_name.lower() and metadata.units.anomaly_equivalence(
@@ -227,12 +259,7 @@ class Style:
                 **self._kwargs,
             )
 
-        cmap, norm = styles.colors.cmap_and_norm(
-            self._colors,
-            levels,
-            self.normalize,
-            self.extend,
-        )
+        cmap, norm = self._cmap_and_norm(self._colors, levels)
 
         cmap.set_bad(self._missing_value_color)
 
@@ -424,9 +451,7 @@ class Style:
         colors = cmap(norm(values))
 
         if not isinstance(values, (int, float, str)):
-            for i, v in enumerate(values):
-                if np.isnan(v):
-                    colors[i] = self._missing_value_color
+            colors[np.isnan(values)] = self._missing_value_color
 
         return colors
 
@@ -556,12 +581,7 @@ class Contour(Style):
 
     def to_contour_kwargs(self, data):
         levels = self.levels(data)
-        cmap, norm = styles.colors.cmap_and_norm(
-            self._line_colors,
-            levels,
-            self.normalize,
-            self.extend,
-        )
+        cmap, norm = self._cmap_and_norm(self._line_colors, levels)
 
         return {
             **{"cmap": cmap, "norm": norm, "levels": levels},
@@ -618,34 +638,44 @@ class Hatched(Contour):
         mappable = super().contourf(*args, hatches=self.hatches, **kwargs)
 
         line_colors = colors.expand(self._foreground_colors, mappable.levels)
-
-        for i, collection in enumerate(mappable.collections):
-            collection.set_edgecolor(line_colors[i])
-            collection.set_linewidth(0)
+        # Kept for this mappable's legends, which hatch the same levels
+        mappable._hatch_colors = line_colors
+
+        if isinstance(mappable, Collection):
+            # Since matplotlib 3.8 all filled levels form a single collection,
+            # so their hatch colors are set in one call
+            mappable.set_edgecolor(line_colors[: len(mappable.get_paths())])
+            mappable.set_linewidth(0)
+        else:
+            for color, collection in zip(line_colors, mappable.collections):
+                collection.set(edgecolor=color, linewidth=0)
 
         return mappable
 
     def colorbar(self, *args, **kwargs):
         colorbar = super().colorbar(*args, **kwargs)
 
-        levels = colorbar.mappable.levels
-
-        line_colors = colors.expand(self._foreground_colors, levels)
-        for i, artist in enumerate(colorbar.solids_patches):
-            artist.set_edgecolor(line_colors[i])
+        line_colors = self._hatch_colors(colorbar.mappable)
+        for color, artist in zip(line_colors, colorbar.solids_patches):
+            artist.set_edgecolor(color)
 
         return colorbar
 
     def disjoint(self, layer, *args, **kwargs):
         legend = super().disjoint(layer, *args, **kwargs)
 
-        line_colors = colors.expand(self._foreground_colors, layer.mappable.levels)
-
+        line_colors = self._hatch_colors(layer.mappable)
         for color, artist in zip(line_colors, legend.get_patches()):
-            artist.set_edgecolor(color)
-            artist.set_linewidth(0.0)
+            artist.set(edgecolor=color, linewidth=0.0)
 
         return legend
 
+    def _hatch_colors(self, mappable):
+        """Get the hatch colors of each level of a mappable."""
+        line_colors = getattr(mappable, "_hatch_colors", None)
+        if line_colors is None:
+            line_colors = colors.expand(self._foreground_colors, mappable.levels)
+        return line_colors
+
 
 DEFAULT_STYLE = Style()
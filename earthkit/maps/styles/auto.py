@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import glob
 import os
+from functools import lru_cache
 
 import yaml
 
@@ -21,6 +23,17 @@ from earthkit.maps import definitions, styles
 from earthkit.maps.metadata.units import are_equal
 
 
+@lru_cache(maxsize=8)
+def _load_style_library(styles_path):
+    """Get the (shared) parsed style configurations in a style library."""
+    configs = []
+    for fname in glob.glob(styles_path):
+        if os.path.isfile(fname):
+            with open(fname, "r") as f:
+                configs.append(yaml.load(f, Loader=yaml.SafeLoader))
+    return tuple(configs)
+
+
 def guess_style(data, units=None):
     from earthkit.maps import schema
 
@@ -31,13 +44,7 @@ def guess_style(data, units=None):
             "*" if schema.style_library == "default" else f"{schema.style_library}/*"
         )
 
-    for fname in glob.glob(str(styles_path)):
-        if os.path.isfile(fname):
-            with open(fname, "r") as f:
-                config = yaml.load(f, Loader=yaml.SafeLoader)
-        else:
-            continue
-
+    for config in _load_style_library(str(styles_path)):
         for criteria in config["criteria"]:
             for key, value in criteria.items():
                 if data.metadata(key, default=None) != value:
@@ -60,4 +67,6 @@ def guess_style(data, units=None):
             # No style matching units found; return default
             return styles.Style(units=units)
 
-    return styles.Style.from_dict(style)
+    # The parsed library is shared between calls, so never hand it out to be
+    # modified
+    return styles.Style.from_dict(copy.deepcopy(style))
@@ -24,14 +24,15 @@ def expand(colors, levels, extend_colors=0):
     length = len(levels) + extend_colors
 
     if isinstance(colors, (list, tuple)) and len(colors) == 1:
-        colors *= length - 1
+        colors = colors * (length - 1)
     if isinstance(colors, str):
         try:
             cmap = mpl.colormaps[colors]
         except KeyError:
             colors = [colors] * (length - 1)
         else:
-            colors = [cmap(i) for i in np.linspace(0, 1, length)]
+            # A single vectorised lookup into the colormap's table
+            colors = [tuple(rgba) for rgba in cmap(np.linspace(0, 1, length))]
     return colors
 
 
@@ -73,18 +74,22 @@ def cmap_and_norm(colors, levels, normalize=True, extend=None):
 
 def gradients(levels, colors, gradients, normalize, **kwargs):
 
-    normalised = (levels - np.min(levels)) / (np.max(levels) - np.min(levels))
+    levels = np.asarray(levels)
+    min_level, max_level = levels.min(), levels.max()
+    normalised = (levels - min_level) / (max_level - min_level)
     color_bins = list(zip(normalised, colors))
     cmap = LinearSegmentedColormap.from_list(name="", colors=color_bins, N=255)
 
     if not isinstance(gradients, (list, tuple)):
         gradients = [gradients] * (len(levels) - 1)
 
-    extrapolated_levels = []
-    for i in range(len(levels) - 1):
-        bins = list(np.linspace(levels[i], levels[i + 1], gradients[i]))
-        extrapolated_levels += bins[(1 if i != 0 else 0) :]
-    levels = extrapolated_levels
+    # Each segment's first level is the previous segment's last level
+    levels = np.concatenate(
+        [
+            np.linspace(levels[i], levels[i + 1], gradients[i])[(1 if i else 0) :]
+            for i in range(len(levels) - 1)
+        ]
+    ).tolist()
 
     norm = None
     if normalize:
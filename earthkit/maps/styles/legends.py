@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from matplotlib.ticker import StrMethodFormatter
 
 DEFAULT_LEGEND_LABEL = "{variable_name} ({units})"
 
@@ -43,6 +44,10 @@ _DISJOINT_LEGEND_LOCATIONS = {
 }
 
 
+#: Format of colorbar tick labels, unless otherwise specified
+DEFAULT_TICK_FORMAT = "{x:g}"
+
+
 def colorbar(layer, *args, shrink=0.8, aspect=35, ax=None, **kwargs):
     """
     Produce a colorbar for a given layer.
@@ -58,7 +63,9 @@ def colorbar(layer, *args, shrink=0.8, aspect=35, ax=None, **kwargs):
     label = layer.format_string(label)
 
     kwargs = {**layer.style._legend_kwargs, **kwargs}
-    kwargs.setdefault("format", lambda x, _: f"{x:g}")
+    if "format" not in kwargs:
+        # Formatters are bound to a single axis, so each colorbar gets its own
+        kwargs["format"] = StrMethodFormatter(DEFAULT_TICK_FORMAT)
 
     if ax is None:
         kwargs["ax"] = layer.axes
@@ -120,6 +127,6 @@ def disjoint(layer, *args, location="bottom", frameon=False, **kwargs):
         layer.fig.add_artist(layer.fig._previous_legend)
     layer.fig._previous_legend = legend
 
-    layer.fig.canvas.draw()
+    layer.fig.draw_without_rendering()
 
     return legend
@@ -64,12 +64,12 @@ def auto_range(data, divergence_point=None, n_levels=8):
         start,
         start + (bin_width * n_levels) + bin_width,
         bin_width,
-    ).tolist()
+    )
 
-    while levels[-2] >= max_value:
-        levels = levels[:-1]
+    # Drop any levels beyond the first level to reach the maximum value
+    levels = levels[: np.searchsorted(levels, max_value) + 1]
 
-    return levels
+    return levels.tolist()
 
 
 def step_range(data, step, reference=None):
@@ -100,16 +100,16 @@ def step_range(data, step, reference=None):
     if reference is None:
         reference = step
 
-    min_value = np.nanmin(data)
+    data_min = np.nanmin(data)
     max_value = np.nanmax(data)
 
     max_modifier = reference % step
     min_modifier = max_modifier if max_modifier == 0 else step - max_modifier
 
-    min_value = min_value - (min_value % step) - min_modifier
+    min_value = data_min - (data_min % step) - min_modifier
 
     levels = np.arange(min_value, max_value + step, step).tolist()
-    if levels[1] <= np.nanmin(data):
+    if levels[1] <= data_min:
         levels = levels[1:]
 
     return levels
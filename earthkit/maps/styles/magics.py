@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import ast
+from functools import lru_cache
 
 import numpy as np
 from matplotlib import colors
@@ -127,6 +128,7 @@ class MagicsStyle:
         return contour_colours
 
 
+@lru_cache(maxsize=1024)
 def parse_color(color):
     color = color.lower()
     if color.startswith("rgb"):
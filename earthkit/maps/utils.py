@@ -49,8 +49,15 @@ def list_to_human(iterable, conjunction="and", oxford_comma=False):
         If `True`, an "Oxford comma" will be added before the conjunction when
         there are three or more elements in the list. Default is `False`.
     """
-    list_of_strs = [str(item) for item in iterable]
+    items = list(iterable)
 
+    # Most titles collapse to one or two values, which need no slicing
+    if len(items) == 1:
+        return str(items[0])
+    if len(items) == 2:
+        return f"{items[0]!s} {conjunction} {items[1]!s}"
+
+    list_of_strs = [str(item) for item in items]
     if len(list_of_strs) > 2:
         list_of_strs = [", ".join(list_of_strs[:-1]), list_of_strs[-1]]
         if oxford_comma:
@@ -0,0 +1,2 @@
+# Do not change! Do not track in version control!
+__version__ = "0.1.dev1+g5c69e4f15"
@@ -0,0 +1,31 @@
+# Copyright 2023, European Centre for Medium Range Weather Forecasts.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from earthkit.maps import Chart
+from earthkit.maps.styles import Style
+
+
+def test_legend_too_few_locations():
+    x, y = np.meshgrid(np.arange(-180, 180, 10.0), np.arange(90, -91, -10.0))
+    values = np.cos(np.deg2rad(y))
+    chart = Chart()
+    chart.contourf(values, x=x, y=y, style=Style(levels=[0, 0.5, 1]))
+    chart.contourf(values, x=x, y=y, style=Style(levels=[0, 0.5, 1]))
+    with pytest.raises(ValueError):
+        chart.legend(location=["bottom"])
+    plt.close("all")
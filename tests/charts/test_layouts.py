@@ -0,0 +1,39 @@
+# Copyright 2023, European Centre for Medium Range Weather Forecasts.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from earthkit.maps.charts import layouts
+
+
+def test_rows_cols_presets():
+    assert layouts.rows_cols(4) == (1, 4)
+    assert layouts.rows_cols(11) == (3, 4)
+
+
+def test_rows_cols_max_cols():
+    assert layouts.rows_cols(24) == (3, 8)
+    assert layouts.rows_cols(25) == (4, 8)
+
+
+def test_rows_cols_fixed_rows_or_cols():
+    assert layouts.rows_cols(6, rows=1) == (1, 6)
+    assert layouts.rows_cols(7, rows=2) == (2, 4)
+    assert layouts.rows_cols(7, cols=1) == (7, 1)
+    assert layouts.rows_cols(8, cols=4) == (2, 4)
+
+
+def test_rows_cols_too_many():
+    with pytest.raises(ValueError):
+        layouts.rows_cols(7, rows=2, cols=3)
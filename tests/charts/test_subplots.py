@@ -0,0 +1,87 @@
+# Copyright 2023, European Centre for Medium Range Weather Forecasts.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cartopy.crs as ccrs
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from earthkit.maps import Chart
+from earthkit.maps.domains.domain import NO_TRANSFORM_FIRST
+from earthkit.maps.styles import Style
+
+
+@pytest.fixture
+def global_0_360():
+    lon = np.arange(0, 360, 2.0)
+    lat = np.arange(90, -91, -2.0)
+    x, y = np.meshgrid(lon, lat)
+    values = np.cos(np.deg2rad(y)) * np.sin(np.deg2rad(x))
+    return values, x, y
+
+
+def test_contourf_wraps_0_360_longitudes(global_0_360):
+    values, x, y = global_0_360
+    chart = Chart()
+    chart.contourf(values, x=x, y=y, style=Style(levels=[-1, 0, 1]))
+    x_min, x_max = chart.subplots[0].ax.get_xlim()
+    plt.close("all")
+    assert x_min < -170
+    assert x_max == pytest.approx(180)
+
+
+@pytest.mark.parametrize("crs_class", NO_TRANSFORM_FIRST)
+def test_contour_has_no_seam_lines(crs_class):
+    lon = np.arange(-180, 180, 2.0)
+    lat = np.arange(90, -91, -2.0)
+    x, y = np.meshgrid(lon, lat)
+    values = np.cos(np.deg2rad(y)) * np.sin(np.deg2rad(x))
+
+    crs = crs_class(central_longitude=10)
+    chart = Chart(crs=crs)
+    layer = chart.contour(values, x=x, y=y, style=Style(levels=[-0.5, 0, 0.5]))
+    ax = chart.subplots[0].ax
+    mappable = layer.layers[0].mappable
+    transform = mappable.get_transform() - ax.transData
+
+    # No drawn line segment should jump across the map
+    longest = 0
+    for path in mappable.get_paths():
+        path = transform.transform_path(path)
+        lengths = np.hypot(*np.diff(path.vertices, axis=0).T)
+        if path.codes is not None:
+            lengths = lengths[path.codes[1:] == Path.LINETO]
+        lengths = lengths[np.isfinite(lengths)]
+        if lengths.size:
+            longest = max(longest, lengths.max())
+    plt.close("all")
+    assert longest < 0.75 * np.diff(crs.x_limits)[0]
+
+
+def test_contour_extent_on_nearside_perspective():
+    lon = np.arange(-180, 180, 2.0)
+    lat = np.arange(90, -91, -2.0)
+    x, y = np.meshgrid(lon, lat)
+    values = np.cos(np.deg2rad(y)) * np.sin(np.deg2rad(x))
+    crs = ccrs.NearsidePerspective(10, 50)
+
+    chart = Chart(crs=crs)
+    chart.contour(values, x=x, y=y, style=Style(levels=[-0.5, 0, 0.5]))
+    ax = chart.subplots[0].ax
+    plt.close("all")
+
+    # Full disk width, clipped to the extent of the contours vertically
+    assert ax.get_xlim() == pytest.approx(crs.x_limits)
+    assert ax.get_ylim() == pytest.approx((-5401200.17, 5438613.36))
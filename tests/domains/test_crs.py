@@ -49,3 +49,14 @@ def test_parse():
             **{k: v for k, v in kwargs.items() if k != "name"}
         )
     )
+
+
+def test_from_projection():
+    from earthkit.data.utils.projections import Projection
+
+    proj_string = "+proj=laea +lat_0=52 +lon_0=10 +ellps=GRS80"
+    first = Projection.from_proj_string(proj_string)
+    second = Projection.from_proj_string(proj_string)
+
+    assert crs.from_projection(first) == first.to_cartopy_crs()
+    assert crs.from_projection(second) is crs.from_projection(first)
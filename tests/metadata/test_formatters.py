@@ -22,6 +22,52 @@ def test_BaseFormatter_conversion():
     assert formatters.BaseFormatter().format("My {TeSt!l}") == "My test"
 
 
+def test_BaseFormatter_repeated_keys():
+    class CountingFormatter(formatters.BaseFormatter):
+        calls = 0
+
+        def format_key(self, key):
+            self.calls += 1
+            return key
+
+    formatter = CountingFormatter()
+    assert formatter.format("{a} {b} {a!u}") == "a b A"
+    assert formatter.calls == 2
+
+
+def test_SubplotFormatter_unique_values():
+    formatter = formatters.SubplotFormatter(None)
+    assert formatter.format_field(["a", "b", "a"], "") == "a and b"
+    assert formatter.format_field(["a", "a"], "") == "a"
+    assert formatter.format_field([1.0, 1.04], ".1f") == "1.0"
+
+    formatter = formatters.SubplotFormatter(None, unique=False)
+    assert formatter.format_field(["a", "a"], "") == "a and a"
+
+
+def test_SubplotFormatter_single_value():
+    formatter = formatters.SubplotFormatter(None)
+    assert formatter.format_field([1.04], ".1f") == "1.0"
+    assert formatter.format_field([["a", "b"]], "") == "['a', 'b']"
+
+
+def test_LayerFormatter_caches_metadata():
+    from earthkit.maps.charts.layers import Layer
+
+    class CountingData:
+        calls = 0
+
+        def metadata(self, key, default=None):
+            self.calls += 1
+            return {"name": "Temperature"}.get(key, default)
+
+    data = CountingData()
+    layer = Layer(data, None, None)
+    assert layer.format_string("{name} / {name!u}") == "Temperature / TEMPERATURE"
+    assert layer.format_string("{name}") == "Temperature"
+    assert data.calls == 1
+
+
 def test_TimeFormatter_time():
     time = datetime(2020, 1, 1)
     assert formatters.TimeFormatter(time).time == [datetime(2020, 1, 1)]
@@ -12,23 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import builtins
+
 import pytest
 
 from earthkit.maps.metadata import units
 
 
-@pytest.mark.skipif(units._NO_CF_UNITS, reason="cf-units is not installed")
+@pytest.mark.skipif(not units._has_cf_units(), reason="cf-units is not installed")
 def test_are_equal():
     assert units.are_equal("K", "kelvin") is True
     assert units.are_equal("celsius", "kelvin") is False
 
 
-@pytest.mark.skipif(units._NO_CF_UNITS, reason="cf-units is not installed")
+def test_are_equal_identical_strings(monkeypatch):
+    monkeypatch.setattr(units, "_NO_CF_UNITS", True)
+    assert units.are_equal("kelvin", "kelvin") is True
+
+
+@pytest.mark.skipif(not units._has_cf_units(), reason="cf-units is not installed")
 def test_convert():
     assert units.convert(273.15, "kelvin", "celsius") == 0
 
 
-@pytest.mark.skipif(units._NO_CF_UNITS, reason="cf-units is not installed")
+@pytest.mark.skipif(not units._has_cf_units(), reason="cf-units is not installed")
 def test_anomaly_equivalence():
     assert units.anomaly_equivalence("celsius") is True
     assert units.anomaly_equivalence("kelvin") is True
@@ -42,7 +49,25 @@ def test_format_units_no_cf_units():
     units._NO_CF_UNITS = _no_cf_units
 
 
-@pytest.mark.skipif(units._NO_CF_UNITS, reason="cf-units is not installed")
+def test_format_units_cf_units_fails_to_import(monkeypatch):
+    real_import = builtins.__import__
+
+    def failing_import(name, *args, **kwargs):
+        if name.split(".")[0] == "cf_units":
+            raise OSError("libudunits2.so.0: cannot open shared object file")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", failing_import)
+    monkeypatch.setattr(units, "_NO_CF_UNITS", False)
+    monkeypatch.setattr(units, "_CF_UNITS_IMPORTED", False)
+    assert units.format_units("celsius") == "$°C$"
+    assert units._NO_CF_UNITS is True
+    with pytest.raises(ImportError):
+        units.convert(273.15, "kelvin", "celsius")
+
+
+@pytest.mark.skipif(not units._has_cf_units(), reason="cf-units is not installed")
 def test_format_units_with_cf_units():
     assert units.format_units("celsius") == "$°C$"
+    assert units.format_units("degC") == "$°C$"
     assert units.format_units("s-1") == "${s}^{-1}$"
@@ -38,19 +38,26 @@ def test_Style_levels():
         dynamic_style.levels()
 
 
-@pytest.mark.skipif(units._NO_CF_UNITS, reason="cf-units is not installed")
+@pytest.mark.skipif(not units._has_cf_units(), reason="cf-units is not installed")
 def test_Style_units():
     style = styles.Style(units="celsius")
     assert style.units == "$°C$"
 
 
-@pytest.mark.skipif(units._NO_CF_UNITS, reason="cf-units is not installed")
+@pytest.mark.skipif(not units._has_cf_units(), reason="cf-units is not installed")
 def test_Style_convert_units():
     style = styles.Style(units="celsius")
     assert style.convert_units(273.15, source_units="kelvin") == 0
 
 
-@pytest.mark.skipif(units._NO_CF_UNITS, reason="cf-units is not installed")
+@pytest.mark.skipif(not units._has_cf_units(), reason="cf-units is not installed")
+def test_Style_convert_units_same_units():
+    style = styles.Style(units="degC")
+    values = np.array([1.0, 2.0, 3.0])
+    assert style.convert_units(values, source_units="celsius") is values
+
+
+@pytest.mark.skipif(not units._has_cf_units(), reason="cf-units is not installed")
 def test_Style_convert_units_anomaly():
     style = styles.Style(units="celsius")
     assert (
@@ -69,3 +76,17 @@ def test_Style_values_to_colors():
         [1.0, 0.0, 0.0, 1.0],
         [0.0, 0.0, 0.0, 0.0],
     ]
+
+
+def test_Style_to_matplotlib_kwargs_shares_cmap():
+    style = styles.Style(levels=[1, 2, 3, 4], colors=["red", "green", "blue"])
+    kwargs = style.to_matplotlib_kwargs(None)
+    assert style.to_matplotlib_kwargs(None)["cmap"] is kwargs["cmap"]
+    assert style.to_matplotlib_kwargs(None)["norm"] is kwargs["norm"]
+
+
+def test_Style_cmap_cache_is_bounded():
+    style = styles.Style(colors="viridis")
+    for i in range(styles.Style.CMAP_CACHE_SIZE * 4):
+        style.to_matplotlib_kwargs(np.array([i, i + 10]))
+    assert len(style._cmap_cache) == styles.Style.CMAP_CACHE_SIZE
@@ -27,3 +27,9 @@ def test_expand():
     assert colors.expand("viridis", [1, 2])[1] == pytest.approx(
         [0.993, 0.906, 0.144, 1.000], 0.1
     )
+
+
+def test_expand_does_not_modify_colors():
+    single_color = ["red"]
+    assert colors.expand(single_color, [1, 2, 3]) == ["red", "red"]
+    assert single_color == ["red"]
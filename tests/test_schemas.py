@@ -78,3 +78,12 @@ def test_Schema_use():
     schema.use("ecmwf")
 
     assert schema.use_preferred_styles is True
+
+
+def test_Schema_use_does_not_share_values():
+    schema = schemas.Schema()
+    schema.use("default")
+    schema.figsize.append(None)
+
+    schema.use("default")
+    assert None not in schema.figsize